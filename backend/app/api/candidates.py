@@ -7,6 +7,8 @@ from typing import Optional, List
 from backend.app.db import get_session
 from backend.app.models import Candidate
 from backend.app.services.llm_client import extract_skills
+from backend.app.services.skill_store import get_skill_store
+from backend.app.services.notifier import notify_candidate
 
 router = APIRouter()
 
@@ -44,10 +46,17 @@ def _run_extraction_and_save(candidate_id: int):
             cand.extracted_skills = json.dumps(skills)
             session.add(cand)
             session.commit()
+            get_skill_store().set_candidate(candidate_id, skills)
         except Exception as e:
             # swallow exceptions in background task; log to stderr
             import sys
             print("Background extraction failed:", e, file=sys.stderr)
+            return
+        try:
+            notify_candidate(session, candidate_id)
+        except Exception as e:
+            import sys
+            print(f"Saved-search notification failed for candidate {candidate_id}: {e}", file=sys.stderr)
 
 @router.post("/candidates", response_model=CandidateRead)
 def create_candidate(
@@ -132,10 +141,17 @@ def trigger_candidate_extraction(candidate_id: int, background_tasks: Background
                 c.extracted_skills = json.dumps(skills)
                 s.add(c)
                 s.commit()
+                get_skill_store().set_candidate(cid, skills)
             except Exception as e:
                 # log to stderr so it appears in uvicorn logs
                 import sys
                 print(f"Background extraction failed for candidate {cid}: {e}", file=sys.stderr)
+                return
+            try:
+                notify_candidate(s, cid)
+            except Exception as e:
+                import sys
+                print(f"Saved-search notification failed for candidate {cid}: {e}", file=sys.stderr)
 
     background_tasks.add_task(_do_extract, candidate_id)
     return {"status": "scheduled", "candidate_id": candidate_id}
@@ -1,11 +1,11 @@
-import json
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session
 from typing import Any
 from backend.app.db import get_session
 from backend.app.models import Candidate, Job, Match
 from backend.app.services.llm_client import explain_match
-from backend.app.services.matcher import match_resume_to_job
+from backend.app.services.matcher import match_ids, SCORERS, DEFAULT_SCORER
+from backend.app.services.skill_store import get_skill_store, parse_skills
 
 router = APIRouter()
 
@@ -14,30 +14,32 @@ def compute_match(
     candidate_id: int,
     job_id: int,
     explain: bool = Query(False, description="If true, call LLM to generate explanation"),
+    scorer: str = Query(DEFAULT_SCORER, description=f"Scoring mode: one of {sorted(SCORERS)}"),
     session: Session = Depends(get_session),
 ) -> Any:
+    if scorer not in SCORERS:
+        raise HTTPException(status_code=400, detail=f"unknown scorer, expected one of {sorted(SCORERS)}")
+
     candidate = session.get(Candidate, candidate_id)
     job = session.get(Job, job_id)
     if not candidate or not job:
         raise HTTPException(status_code=404, detail="candidate or job not found")
 
-    try:
-        skills_cand = json.loads(candidate.extracted_skills) if candidate.extracted_skills else []
-    except Exception:
-        skills_cand = []
-
-    try:
-        skills_job = json.loads(job.extracted_skills) if job.extracted_skills else []
-    except Exception:
-        skills_job = []
+    store = get_skill_store()
+    cand_ids = store.candidate_ids(candidate.id)
+    if cand_ids is None:
+        cand_ids = store.set_candidate(candidate.id, parse_skills(candidate.extracted_skills))
+    job_ids = store.job_ids(job.id)
+    if job_ids is None:
+        job_ids = store.set_job(job.id, parse_skills(job.extracted_skills))
 
-    match = match_resume_to_job(skills_cand, skills_job)
+    match = match_ids(cand_ids, job_ids, store.decode, scorer=scorer, stats=store)
 
     explanation_text = None
     recommendations = []
     if explain:
         # will call the LLM (ensure OPENAI_API_KEY in .env and server restarted)
-        explanation = explain_match(skills_cand, skills_job, match["score"])
+        explanation = explain_match(match["candidate_skills_canonical"], match["job_skills_canonical"], match["score"])
         explanation_text = explanation.get("explanation")
         recommendations = explanation.get("recommendations") or []
 
@@ -52,6 +54,7 @@ def compute_match(
         "job_id": job.id,
         "candidate_id": candidate.id,
         "score": match["score"],
+        "scorer": scorer,
         "matching_skills": match["matching_skills"],
         "missing_skills": match["missing_skills"],
         "explanation": explanation_text or "explanation-skipped",
@@ -32,6 +32,8 @@ def _background_extract_and_save(cid: int):
     from sqlmodel import create_engine as _create_engine
     from backend.app.models import Candidate as DBCandidate
     from backend.app.services.llm_client import extract_skills as _extract_skills
+    from backend.app.services.skill_store import get_skill_store
+    from backend.app.services.notifier import notify_candidate
 
     engine = _create_engine("sqlite:///./llm_job_portal.db", echo=False)
     with DBSession(engine) as s:
@@ -43,9 +45,16 @@ def _background_extract_and_save(cid: int):
             c.extracted_skills = json.dumps(skills)
             s.add(c)
             s.commit()
+            get_skill_store().set_candidate(cid, skills)
         except Exception as e:
             import sys
             print(f"Background extraction failed for candidate {cid}: {e}", file=sys.stderr)
+            return
+        try:
+            notify_candidate(s, cid)
+        except Exception as e:
+            import sys
+            print(f"Saved-search notification failed for candidate {cid}: {e}", file=sys.stderr)
 
 @router.post("/resumes")
 async def upload_resume(
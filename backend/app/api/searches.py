@@ -0,0 +1,163 @@
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from sqlmodel import Session, select
+from typing import Optional, List
+from backend.app.db import get_session, engine
+from backend.app.models import Job, SavedSearch, Notification
+from backend.app.services.matcher import SCORERS, DEFAULT_SCORER
+from backend.app.services.notifier import get_search_index
+from backend.app.services.skill_store import get_skill_store, parse_skills
+
+router = APIRouter()
+
+# How often waiting long-poll / SSE clients look for new notifications.
+# The in-memory SearchIndex.latest_notification_id is only bumped by this
+# process, so it is a fast path for a single uvicorn worker; with several
+# workers (or writes from scripts) waiters still hit the DB every
+# _DB_RECHECK seconds so nothing is missed, just delivered a bit later.
+_POLL_INTERVAL = 0.5
+_DB_RECHECK = 5.0
+
+class SearchCreate(BaseModel):
+    job_id: Optional[int] = Field(None, example=1)
+    skills: Optional[List[str]] = Field(None, example=["python", "pytorch"])
+    threshold: float = Field(50.0, ge=0, le=100, example=60.0)
+    scorer: str = Field(DEFAULT_SCORER, example="idf")
+
+def _search_out(s: SavedSearch) -> dict:
+    return {
+        "id": s.id,
+        "job_id": s.job_id,
+        "skills": json.loads(s.skills) if s.skills else None,
+        "threshold": s.threshold,
+        "scorer": s.scorer,
+        "created_at": str(s.created_at),
+    }
+
+def _notification_out(n: Notification) -> dict:
+    return {
+        "id": n.id,
+        "search_id": n.search_id,
+        "candidate_id": n.candidate_id,
+        "job_id": n.job_id,
+        "score": n.score,
+        "created_at": str(n.created_at),
+    }
+
+@router.post("/searches")
+def create_search(payload: SearchCreate, session: Session = Depends(get_session)):
+    """
+    Register a standing query. New or re-extracted candidates that reach
+    `threshold` (0-100, using `scorer`) are appended to /notifications.
+    """
+    if payload.scorer not in SCORERS:
+        raise HTTPException(status_code=400, detail=f"unknown scorer, expected one of {sorted(SCORERS)}")
+    if payload.job_id is None and not payload.skills:
+        raise HTTPException(status_code=400, detail="either job_id or skills is required")
+    if payload.job_id is not None and payload.skills:
+        raise HTTPException(status_code=400, detail="pass either job_id or skills, not both")
+    if payload.job_id is not None:
+        job = session.get(Job, payload.job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="job not found")
+        store = get_skill_store()
+        job_ids = store.job_ids(job.id)
+        if job_ids is None:
+            job_ids = store.set_job(job.id, parse_skills(job.extracted_skills))
+        if not job_ids:
+            # a search with no skills sits in no posting list and would never fire
+            raise HTTPException(status_code=409, detail="job has no extracted skills")
+
+    search = SavedSearch(
+        job_id=payload.job_id,
+        skills=json.dumps(payload.skills) if payload.job_id is None else None,
+        threshold=payload.threshold,
+        scorer=payload.scorer,
+    )
+    session.add(search)
+    session.commit()
+    session.refresh(search)
+    get_search_index().add(search)
+    return _search_out(search)
+
+@router.get("/searches")
+def list_searches(session: Session = Depends(get_session)):
+    return [_search_out(s) for s in session.exec(select(SavedSearch)).all()]
+
+@router.delete("/searches/{search_id}")
+def delete_search(search_id: int, session: Session = Depends(get_session)):
+    search = session.get(SavedSearch, search_id)
+    if not search:
+        raise HTTPException(status_code=404, detail="search not found")
+    for n in session.exec(select(Notification).where(Notification.search_id == search_id)).all():
+        session.delete(n)
+    session.delete(search)
+    session.commit()
+    get_search_index().remove(search_id)
+    return {"status": "deleted", "search_id": search_id}
+
+def _fetch_after(after_id: int, search_id: Optional[int], limit: int) -> List[dict]:
+    with Session(engine) as s:
+        q = select(Notification).where(Notification.id > after_id)
+        if search_id is not None:
+            q = q.where(Notification.search_id == search_id)
+        q = q.order_by(Notification.id).limit(limit)
+        return [_notification_out(n) for n in s.exec(q).all()]
+
+@router.get("/notifications")
+async def poll_notifications(
+    after_id: int = Query(0, description="Return notifications with id greater than this"),
+    search_id: Optional[int] = None,
+    timeout: float = Query(25.0, ge=0, le=60, description="Seconds to wait for new notifications"),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """
+    Long-poll: returns as soon as there is anything newer than after_id, or an
+    empty list after `timeout` seconds. Pass the last id back as after_id.
+    """
+    index = get_search_index()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    next_db_check = loop.time()
+    seen = after_id
+    while True:
+        # cheap in-memory check first; fall back to the DB periodically
+        latest = index.latest_notification_id
+        if latest > seen or loop.time() >= next_db_check:
+            items = await run_in_threadpool(_fetch_after, after_id, search_id, limit)
+            if items:
+                return items
+            seen = max(seen, latest)
+            next_db_check = loop.time() + _DB_RECHECK
+        if loop.time() >= deadline:
+            return []
+        await asyncio.sleep(_POLL_INTERVAL)
+
+@router.get("/notifications/stream")
+async def stream_notifications(after_id: int = 0, search_id: Optional[int] = None):
+    """Server-sent events feed of notifications; each event id is the notification id."""
+    index = get_search_index()
+
+    async def events():
+        loop = asyncio.get_running_loop()
+        next_db_check = loop.time()
+        last = after_id
+        seen = after_id
+        while True:
+            latest = index.latest_notification_id
+            if latest > seen or loop.time() >= next_db_check:
+                items = await run_in_threadpool(_fetch_after, last, search_id, 1000)
+                for item in items:
+                    last = item["id"]
+                    yield f"id: {item['id']}\nevent: notification\ndata: {json.dumps(item)}\n\n"
+                if len(items) < 1000:
+                    seen = max(seen, latest)
+                    next_db_check = loop.time() + _DB_RECHECK
+                continue
+            await asyncio.sleep(_POLL_INTERVAL)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
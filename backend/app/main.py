@@ -4,8 +4,10 @@ from backend.app.api.matches import router as matches_router
 from backend.app.api.candidates import router as candidates_router
 from .services.llm_client import extract_skills, explain_match
 from .services.matcher import match_resume_to_job
+from .services.skill_store import get_skill_store, parse_skills
+from .services.notifier import get_search_index
 from sqlmodel import Session, select
-from .db import init_db, get_session
+from .db import init_db, get_session, engine
 from .models import Job, Candidate
 from fastapi.middleware.cors import CORSMiddleware
 import pypdf
@@ -19,6 +21,10 @@ app.include_router(candidates_router)
 @app.on_event("startup")
 def on_startup():
     init_db()
+    # build the in-memory skill id arrays once; writes keep them current afterwards
+    with Session(engine) as session:
+        get_skill_store().load(session)
+        get_search_index().load(session)
 
 @app.get("/")
 def root():
@@ -29,6 +35,7 @@ def create_job(job: Job, session: Session = Depends(get_session)):
     session.add(job)
     session.commit()
     session.refresh(job)
+    get_skill_store().set_job(job.id, parse_skills(job.extracted_skills))
     return job
 
 @app.get("/jobs")
@@ -92,6 +99,10 @@ app.include_router(candidates_router)
 from backend.app.api.resumes import router as resumes_router
 app.include_router(resumes_router)
 
+# include saved searches / notifications router
+from backend.app.api.searches import router as searches_router
+app.include_router(searches_router)
+
 origins = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
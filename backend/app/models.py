@@ -1,4 +1,4 @@
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, UniqueConstraint
 from typing import Optional
 import datetime
 
@@ -28,3 +28,23 @@ class Match(SQLModel, table=True):
     score: float
     explanation: Optional[str] = None
     created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+
+class SavedSearch(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # either tied to a job (uses the job's extracted skills) or a free skill filter
+    job_id: Optional[int] = Field(default=None, foreign_key="job.id")
+    skills: Optional[str] = None   # store JSON string, used when job_id is null
+    threshold: float = 50.0
+    scorer: str = "jaccard"
+    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+
+class Notification(SQLModel, table=True):
+    # one notification per (search, candidate); duplicates hit the constraint
+    __table_args__ = (UniqueConstraint("search_id", "candidate_id"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    search_id: int = Field(foreign_key="savedsearch.id", index=True)
+    candidate_id: int = Field(foreign_key="candidate.id")
+    job_id: Optional[int] = Field(default=None, foreign_key="job.id")
+    score: float
+    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
@@ -1,5 +1,5 @@
 # backend/app/services/matcher.py
-from typing import List, Tuple, Dict, Set
+from typing import List, Tuple, Dict, Set, Callable, Sequence
 import re
 
 # Small synonym map to canonicalize common variants.
@@ -72,3 +72,137 @@ def match_resume_to_job(candidate_skills: List[str], job_skills: List[str]) -> D
         "job_skills_canonical": job,
     }
 
+
+# ---- id-set scoring (see services/skill_store.py) ----
+# Skill sets are sorted sequences of interned skill ids (array('I') in the
+# store). Set operations are linear merges over the two sorted runs.
+
+def intersect_ids(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    out = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        x, y = a[i], b[j]
+        if x == y:
+            out.append(x)
+            i += 1
+            j += 1
+        elif x < y:
+            i += 1
+        else:
+            j += 1
+    return out
+
+def difference_ids(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """Ids in a that are not in b."""
+    out = []
+    i = j = 0
+    while i < len(a):
+        if j >= len(b) or a[i] < b[j]:
+            out.append(a[i])
+            i += 1
+        elif a[i] == b[j]:
+            i += 1
+            j += 1
+        else:
+            j += 1
+    return out
+
+def jaccard_ids(a: Sequence[int], b: Sequence[int]) -> float:
+    """Same as jaccard_score, but over sorted skill-id sequences."""
+    if not a and not b:
+        return 100.0
+    if not a or not b:
+        return 0.0
+    inter = len(intersect_ids(a, b))
+    return (inter / (len(a) + len(b) - inter)) * 100.0
+
+# ---- pluggable scorers ----
+# Each scorer takes (cand_ids, job_ids, stats) and returns 0-100. `stats` is
+# anything exposing idf(sid), doc_count() and avg_doc_len() -- in practice the
+# SkillStore, which keeps document frequencies current as extractions land.
+
+def _idf_sum(ids: Sequence[int], stats) -> float:
+    return sum(stats.idf(sid) for sid in ids)
+
+def score_jaccard(cand_ids: Sequence[int], job_ids: Sequence[int], stats=None) -> float:
+    return jaccard_ids(cand_ids, job_ids)
+
+def score_weighted_jaccard(cand_ids: Sequence[int], job_ids: Sequence[int], stats) -> float:
+    """Jaccard where each skill counts with its idf weight instead of 1."""
+    if not cand_ids and not job_ids:
+        return 100.0
+    if not cand_ids or not job_ids:
+        return 0.0
+    inter = _idf_sum(intersect_ids(cand_ids, job_ids), stats)
+    union = _idf_sum(cand_ids, stats) + _idf_sum(job_ids, stats) - inter
+    if union <= 0:
+        return 0.0
+    return (inter / union) * 100.0
+
+def score_idf_overlap(cand_ids: Sequence[int], job_ids: Sequence[int], stats) -> float:
+    """Share of the job's idf mass covered by the candidate; extra candidate skills don't penalize."""
+    if not cand_ids and not job_ids:
+        return 100.0
+    if not cand_ids or not job_ids:
+        return 0.0
+    total = _idf_sum(job_ids, stats)
+    if total <= 0:
+        return 0.0
+    return (_idf_sum(intersect_ids(cand_ids, job_ids), stats) / total) * 100.0
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+def score_bm25(cand_ids: Sequence[int], job_ids: Sequence[int], stats, k1: float = BM25_K1, b: float = BM25_B) -> float:
+    """
+    BM25 with the job's skills as the query and the candidate's skills as the
+    document (tf is always 1). Normalized by the job's full idf mass at
+    length min(dl, |job|): a candidate can't beat it, one holding exactly the
+    job's skills scores 100, and longer candidates keep the length penalty.
+    """
+    if not cand_ids and not job_ids:
+        return 100.0
+    if not cand_ids or not job_ids:
+        return 0.0
+    avgdl = stats.avg_doc_len() or 1.0
+
+    def tf_part(dl: int) -> float:
+        return (k1 + 1.0) / (1.0 + k1 * (1.0 - b + b * dl / avgdl))
+
+    dl = len(cand_ids)
+    best = _idf_sum(job_ids, stats) * tf_part(min(dl, len(job_ids)))
+    if best <= 0:
+        return 0.0
+    raw = _idf_sum(intersect_ids(cand_ids, job_ids), stats) * tf_part(dl)
+    return raw / best * 100.0
+
+SCORERS: Dict[str, Callable[..., float]] = {
+    "jaccard": score_jaccard,
+    "weighted_jaccard": score_weighted_jaccard,
+    "idf": score_idf_overlap,
+    "bm25": score_bm25,
+}
+
+DEFAULT_SCORER = "jaccard"
+
+def get_scorer(name: str) -> Callable[..., float]:
+    try:
+        return SCORERS[name]
+    except KeyError:
+        raise ValueError(f"unknown scorer '{name}', expected one of {sorted(SCORERS)}")
+
+def match_ids(cand_ids: Sequence[int], job_ids: Sequence[int], decode, scorer: str = DEFAULT_SCORER, stats=None) -> Dict[str, any]:
+    """
+    Id-set counterpart of match_resume_to_job. `decode` maps ids back to
+    skill names (SkillStore.decode); it is only used to build the response.
+    `scorer` picks an entry from SCORERS; all but "jaccard" need `stats`.
+    """
+    score = get_scorer(scorer)(cand_ids, job_ids, stats)
+    return {
+        "score": round(score, 2),
+        "scorer": scorer,
+        "matching_skills": sorted(decode(intersect_ids(cand_ids, job_ids))),
+        "missing_skills": sorted(decode(difference_ids(job_ids, cand_ids))),
+        "candidate_skills_canonical": decode(cand_ids),
+        "job_skills_canonical": decode(job_ids),
+    }
@@ -0,0 +1,118 @@
+# backend/app/services/notifier.py
+import threading
+from typing import Dict, List, Sequence, Set
+from backend.app.services.matcher import get_scorer
+from backend.app.services.skill_store import get_skill_store, parse_skills
+
+class SearchIndex:
+    """
+    In-memory inverted index of saved searches (standing queries).
+
+    Each search is held as a sorted skill-id array plus its threshold /
+    scorer, and every skill id points at the searches that mention it. When a
+    candidate's skills land we only score it against searches sharing at
+    least one skill, so the work is proportional to the new data rather than
+    a full scan.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._searches: Dict[int, dict] = {}
+        self._postings: Dict[int, Set[int]] = {}
+        self.latest_notification_id = 0
+
+    def add(self, search) -> None:
+        """Register or refresh a SavedSearch row."""
+        store = get_skill_store()
+        if search.job_id is not None:
+            ids = store.job_ids(search.job_id) or ()
+        else:
+            ids = store.encode(parse_skills(search.skills))
+        with self._lock:
+            self._drop(search.id)
+            self._searches[search.id] = {
+                "ids": ids,
+                "threshold": search.threshold,
+                "scorer": search.scorer,
+                "job_id": search.job_id,
+            }
+            for sid in ids:
+                self._postings.setdefault(sid, set()).add(search.id)
+
+    def remove(self, search_id: int) -> None:
+        with self._lock:
+            self._drop(search_id)
+
+    def _drop(self, search_id: int) -> None:
+        # caller holds self._lock
+        entry = self._searches.pop(search_id, None)
+        if not entry:
+            return
+        for sid in entry["ids"]:
+            ids = self._postings.get(sid)
+            if ids:
+                ids.discard(search_id)
+                if not ids:
+                    del self._postings[sid]
+
+    def hits(self, cand_ids: Sequence[int]) -> List[dict]:
+        """Score cand_ids against the overlapping searches; return those at or above threshold."""
+        with self._lock:
+            search_ids: Set[int] = set()
+            for sid in cand_ids:
+                search_ids |= self._postings.get(sid, set())
+            entries = [(i, dict(self._searches[i])) for i in search_ids]
+        store = get_skill_store()
+        out = []
+        for search_id, entry in entries:
+            score = get_scorer(entry["scorer"])(cand_ids, entry["ids"], store)
+            if score >= entry["threshold"]:
+                out.append({"search_id": search_id, "job_id": entry["job_id"], "score": round(score, 2)})
+        return out
+
+    def load(self, session) -> None:
+        """Register every SavedSearch row (called at startup, after the skill store)."""
+        from sqlmodel import select
+        from backend.app.models import SavedSearch, Notification
+
+        for s in session.exec(select(SavedSearch)).all():
+            self.add(s)
+        last = session.exec(select(Notification.id).order_by(Notification.id.desc())).first()
+        self.latest_notification_id = last or 0
+
+search_index = SearchIndex()
+
+def get_search_index() -> SearchIndex:
+    return search_index
+
+def notify_candidate(session, candidate_id: int) -> List[int]:
+    """
+    Called once a candidate's extracted skills are saved (and the skill store
+    updated). Appends a Notification for each saved search the candidate now
+    meets; searches that already notified for this candidate are skipped via
+    the (search_id, candidate_id) unique constraint, which also keeps two
+    concurrent extractions of the same candidate from double-inserting.
+    Returns the new notification ids.
+    """
+    from sqlalchemy.exc import IntegrityError
+    from backend.app.models import Notification
+
+    cand_ids = get_skill_store().candidate_ids(candidate_id)
+    if not cand_ids:
+        return []
+    index = get_search_index()
+    ids = []
+    # commit per hit so one duplicate doesn't roll back the others; a
+    # candidate only ever hits a handful of searches
+    for hit in index.hits(cand_ids):
+        n = Notification(candidate_id=candidate_id, **hit)
+        session.add(n)
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()  # already notified
+            continue
+        ids.append(n.id)
+    if ids:
+        index.latest_notification_id = max(index.latest_notification_id, max(ids))
+    return ids
@@ -0,0 +1,129 @@
+# backend/app/services/skill_store.py
+import json
+import math
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+from backend.app.services.matcher import canonicalize
+
+class SkillStore:
+    """
+    Process-wide, in-memory index of extracted skills.
+
+    Every canonical skill is interned to a dense integer id and each
+    candidate / job is held as a sorted array('I') of those ids (4 bytes per
+    skill, independent of vocabulary size), so a pairwise comparison is a
+    merge over two short int runs instead of json.loads + canonicalize + set
+    building on every request.
+
+    It also keeps corpus statistics over candidates (per-skill document
+    frequency, total skill count, number of candidates with any skills) up
+    to date as rows change, which the IDF / BM25 scorers in
+    services/matcher.py read through idf(), doc_count() and avg_doc_len().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._candidates: Dict[int, array] = {}
+        self._jobs: Dict[int, array] = {}
+        self._df: List[int] = []
+        self._total_len = 0
+        # candidates with at least one skill; the corpus size for idf / avgdl
+        self._nonempty = 0
+
+    # ---- vocabulary ----
+    def intern(self, skill: str) -> int:
+        sid = self._ids.get(skill)
+        if sid is not None:
+            return sid
+        with self._lock:
+            sid = self._ids.get(skill)
+            if sid is None:
+                sid = len(self._names)
+                self._names.append(skill)
+                self._df.append(0)
+                self._ids[skill] = sid
+            return sid
+
+    def encode(self, skills: Iterable[str]) -> array:
+        """Canonicalize raw skill strings and pack them into a sorted id array."""
+        return array("I", sorted({self.intern(s) for s in canonicalize(list(skills))}))
+
+    def decode(self, ids: Sequence[int]) -> List[str]:
+        """Return the skill names for ids, in the given order."""
+        return [self._names[sid] for sid in ids]
+
+    # ---- candidates / jobs ----
+    def set_candidate(self, candidate_id: int, skills: Optional[List[str]]) -> array:
+        ids = self.encode(skills or [])
+        with self._lock:
+            old = self._candidates.get(candidate_id, ())
+            self._candidates[candidate_id] = ids
+            self._update_stats(old, ids)
+        return ids
+
+    def set_job(self, job_id: int, skills: Optional[List[str]]) -> array:
+        ids = self.encode(skills or [])
+        self._jobs[job_id] = ids
+        return ids
+
+    def candidate_ids(self, candidate_id: int) -> Optional[array]:
+        return self._candidates.get(candidate_id)
+
+    def job_ids(self, job_id: int) -> Optional[array]:
+        return self._jobs.get(job_id)
+
+    # ---- corpus statistics ----
+    def _update_stats(self, old: Sequence[int], new: Sequence[int]) -> None:
+        # caller holds self._lock
+        old_set, new_set = set(old), set(new)
+        for sid in new_set - old_set:
+            self._df[sid] += 1
+        for sid in old_set - new_set:
+            self._df[sid] -= 1
+        self._total_len += len(new) - len(old)
+        self._nonempty += bool(new) - bool(old)
+
+    def doc_count(self) -> int:
+        return self._nonempty
+
+    def idf(self, sid: int) -> float:
+        # BM25-style idf; always positive so every shared skill adds something
+        n = self._nonempty
+        df = self._df[sid]
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def avg_doc_len(self) -> float:
+        n = self._nonempty
+        return self._total_len / n if n else 0.0
+
+    # ---- bulk load ----
+    def load(self, session) -> None:
+        """Populate the store from every Candidate and Job row (called at startup)."""
+        from sqlmodel import select
+        from backend.app.models import Candidate, Job
+
+        # only the two columns we need, streamed; full rows carry resume_text
+        for cid, raw in session.exec(select(Candidate.id, Candidate.extracted_skills)):
+            self.set_candidate(cid, parse_skills(raw))
+        for jid, raw in session.exec(select(Job.id, Job.extracted_skills)):
+            self.set_job(jid, parse_skills(raw))
+
+def parse_skills(raw: Optional[str]) -> List[str]:
+    """Decode an extracted_skills JSON column, tolerating null / bad data."""
+    if not raw:
+        return []
+    try:
+        parsed = json.loads(raw)
+    except Exception:
+        return []
+    if not isinstance(parsed, list):
+        return []
+    return [s for s in parsed if isinstance(s, str)]
+
+skill_store = SkillStore()
+
+def get_skill_store() -> SkillStore:
+    return skill_store